@@ -51,7 +51,10 @@ class ArtifactBuilder:
         self.path = Path(path or artifact.path)
 
         if type is None or format is None:
-            type, format = pta.inspect.artifact_type_format(artifact)
+            # only fill in the values that were not provided
+            artifact_type, artifact_format = pta.inspect.artifact_type_format(artifact)
+            type = artifact_type if type is None else type
+            format = artifact_format if format is None else format
 
         if package_hint is None:
             if hasattr(artifact, 'ARTIFACT_PACKAGE_HINT'):
@@ -90,12 +93,6 @@ class ArtifactBuilder:
             # TODO clean up
             pass
         else:
-            # Log the artifact metadata
-            meta_path = self.path / 'pt_meta.json'
-            try:
-                with open(meta_path, 'wt') as fout:
-                    json.dump(self.metadata, fout)
-            except:
-                if meta_path.exists():
-                    meta_path.unlink()
-                raise
+            # Log the artifact metadata (atomically, so a failed write never leaves a partial pt_meta.json behind)
+            with pta.io.finalized_open(str(self.path / 'pt_meta.json'), 't') as fout:
+                json.dump(self.metadata, fout)
@@ -1,10 +1,47 @@
 """Utility to build a DataFrame from a sequence of dictionaries."""
 
-from itertools import chain
+from functools import reduce
+from itertools import chain, groupby
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
+from pandas.api.extensions import ExtensionArray
+
+
+def _as_array(values: Any) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values
+    # strings are kept as objects; numpy's fixed-width unicode arrays are slow to build and pandas converts them
+    # back to objects anyway
+    return np.asarray(values, dtype=object if isinstance(values[0], str) else None)
+
+
+def _repeat_scalar(value: Any, count: int) -> Any:
+    if count == 1:
+        return [value]
+    # repeat with a (stride-0) view, rather than building a list of references
+    return np.broadcast_to(np.array(value, dtype=object if isinstance(value, str) else None), (count,))
+
+
+def _concat_chunks(chunks: List[Any], total: int) -> np.ndarray:
+    """Concatenates the chunks of a column into a single array of length ``total``."""
+    if not any(hasattr(chunk, 'dtype') for chunk in chunks):
+        # only python sequences: convert them all at once
+        return _as_array(list(chain.from_iterable(chunks)))
+    # convert each run of consecutive python sequences at once, rather than one (often tiny) chunk at a time
+    arrays = []
+    for is_array, run in groupby(chunks, key=lambda chunk: hasattr(chunk, 'dtype')):
+        if is_array:
+            arrays.extend(_as_array(chunk) for chunk in run)
+        else:
+            arrays.append(_as_array(list(chain.from_iterable(run))))
+    result = np.empty(total, dtype=reduce(np.promote_types, {arr.dtype for arr in arrays}))
+    offset = 0
+    for arr in arrays:
+        result[offset:offset+len(arr)] = arr
+        offset += len(arr)
+    return result
 
 
 class DataFrameBuilder:
@@ -24,7 +61,12 @@ class DataFrameBuilder:
         if '_index' not in columns:
             columns = ['_index'] + columns
         self._data = {c: [] for c in columns}
+        # columns that have only received scalars so far; these store one value per call to extend (repeated
+        # according to self._lengths), rather than a list of chunks
+        self._scalar_columns = set(columns)
+        self._lengths = []
         self._auto_index = 0
+        self._size = 0
 
     def extend(self, values: Dict[str, Any]) -> None:
         """Add a dictionary of values to the DataFrameBuilder.
@@ -46,6 +88,14 @@ class DataFrameBuilder:
         if '_index' not in values.keys():
             values['_index'] = self._auto_index
             self._auto_index += 1
+        if len(values) == len(self._data) and self._scalar_columns.issuperset(values) and \
+           all(not hasattr(v, '__len__') or isinstance(v, str) for v in values.values()):
+            # fast path: a single row of scalars, all going to scalar columns
+            for k, v in values.items():
+                self._data[k].append(v)
+            self._size += 1
+            self._lengths.append(1)
+            return
         assert all(c in values.keys() for c in self._data), f"all columns must be provided: {list(self._data)}"
         lens = {k: len(v) for k, v in values.items() if hasattr(v, '__len__') and not isinstance(v, str) and len(v) > 1}
         if any(lens):
@@ -53,10 +103,22 @@ class DataFrameBuilder:
         else:
             first_len = 1 # if nothing has a len, everything is given a length of 1
         assert all(i == first_len for i in lens.values()), f"all values must have the same length {lens}"
+        self._size += first_len
+        self._lengths.append(first_len)
         for k, v in values.items():
+            is_scalar = not hasattr(v, '__len__') or isinstance(v, str)
+            if k in self._scalar_columns:
+                if is_scalar:
+                    self._data[k].append(v)
+                    continue
+                # switch this column over to chunks
+                self._scalar_columns.discard(k)
+                self._data[k] = [_repeat_scalar(s, n) for s, n in zip(self._data[k], self._lengths)]
             if k not in lens:
                 if isinstance(v, (tuple, list)) and len(v) == 1:
                     self._data[k].append(v * first_len)
+                elif is_scalar:
+                    self._data[k].append(_repeat_scalar(v, first_len))
                 else:
                     self._data[k].append([v] * first_len)
             elif isinstance(v, pd.Series):
@@ -76,28 +138,44 @@ class DataFrameBuilder:
         .. versionchanged:: 0.9.3
             Fixed bug with columns that have values of numpy arrays
 
+        .. versionchanged:: 0.12.8
+            Columns built from Series with extension dtypes (e.g., nullable integers or categoricals) keep their dtype.
+
         Args:
             merge_on_index: an optional DataFrame to merge the resulting DataFrame on.
 
         Returns:
             A DataFrame with the values added to the DataFrameBuilder.
         """
-        result = pd.DataFrame({
-            k: (np.concatenate(v)
-                if len(v) > 0 and not isinstance(v[0][0], np.ndarray) else
-                list(chain.from_iterable(v))
-               )
-            for k, v in self._data.items()
-        })
+        columns = {k: self._column(k) for k in self._data}
+        index = columns.pop('_index')
+        # the columns are all freshly-built arrays, so there's no need for pandas to copy them again
+        # the index is given explicitly, since there may be no other columns to infer the length from
+        result = pd.DataFrame(columns, index=pd.RangeIndex(len(index)), copy=False)
         if merge_on_index is not None:
-            merge_on_index = merge_on_index.reset_index(drop=True)
-            result = result.assign(**{
-                col: merge_on_index[col].iloc[result['_index']].values
-                for col in merge_on_index.columns
-                if col not in result.columns
-            })
-            merge_columns = set(merge_on_index.columns)
-            column_order = list(merge_on_index.columns) + [c for c in result.columns if c not in merge_columns]
-            result = result[column_order]
-        result = result.drop(columns=['_index'])
+            merge_columns = [c for c in merge_on_index.columns if c != '_index']
+            # expand all the merged columns with a single (positional) take, rather than one column at a time
+            expanded = merge_on_index[[c for c in merge_columns if c not in result.columns]].take(index)
+            expanded.index = result.index
+            result = pd.concat([expanded, result], axis=1)
+            if len(expanded.columns) != len(merge_columns): # overlapping columns need to be moved into place
+                merge_set = set(merge_columns)
+                column_order = merge_columns + [c for c in result.columns if c not in merge_set]
+                result = result[column_order]
         return result
+
+    def _column(self, k: str) -> Any:
+        v = self._data[k]
+        if len(v) == 0:
+            return []
+        if k in self._scalar_columns:
+            if len(v) == self._size: # one row per value
+                return _as_array(v)
+            return np.repeat(_as_array(v), self._lengths)
+        if isinstance(v[0][0], np.ndarray):
+            return list(chain.from_iterable(v))
+        if any(isinstance(chunk, ExtensionArray) for chunk in v):
+            # let pandas combine extension arrays (e.g., from Series with nullable or categorical dtypes), which
+            # keeps their dtype rather than converting them to numpy
+            return pd.concat([pd.Series(chunk, copy=False) for chunk in v], ignore_index=True).array
+        return _concat_chunks(v, self._size)
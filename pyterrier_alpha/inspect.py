@@ -1,11 +1,16 @@
 """Module for inspecting pyterrier objects."""
-from typing import List, Optional, Protocol, Tuple, Type, Union, runtime_checkable
+import functools
+import weakref
+from importlib.metadata import EntryPoint
+from typing import Dict, List, Optional, Protocol, Tuple, Type, Union, runtime_checkable
 
 import pandas as pd
 import pyterrier as pt
 
 import pyterrier_alpha as pta
 
+_MISSING = object()
+
 
 class InspectError(TypeError):
     """Base exception for inspection errors."""
@@ -32,23 +37,25 @@ def artifact_type_format(
 
     Raises:
         InspectError: If the artifact's type or format could not be determined and ``strict==True``.
-    """
-    artifact_type, artifact_format = None, None
 
+    .. versionchanged:: 0.12.8
+        The entry point lookup is cached for each artifact class. Use ``artifact_type_format.cache_clear()`` to clear
+        the cache (e.g., after installing a package that provides new entry points).
+    """
     # Source #1: ARTIFACT_TYPE and ARTIFACT_FORMAT constants
-    if hasattr(artifact, 'ARTIFACT_TYPE') and hasattr(artifact, 'ARTIFACT_FORMAT'):
-        artifact_type = artifact.ARTIFACT_TYPE
-        artifact_format = artifact.ARTIFACT_FORMAT
+    artifact_type = getattr(artifact, 'ARTIFACT_TYPE', _MISSING)
+    artifact_format = getattr(artifact, 'ARTIFACT_FORMAT', _MISSING)
+    if artifact_type is _MISSING or artifact_format is _MISSING:
+        artifact_type, artifact_format = None, None
 
     # Source #2: entry point name
     if artifact_type is None or artifact_format is None:
-        for entry_point in pta.io.entry_points('pyterrier.artifact'):
-            if artifact.__module__.split('.')[0] != entry_point.value.split(':')[0].split('.')[0]:
-                continue # only try loading entry points that share the same top-level module
-            entry_point_cls = entry_point.load()
-            if isinstance(artifact, type) and artifact == entry_point_cls or isinstance(artifact, entry_point_cls):
-                artifact_type, artifact_format = entry_point.name.split('.', 1)
-                break
+        if isinstance(artifact, type):
+            type_format = _entry_point_type_format(artifact, False)
+        else:
+            type_format = _entry_point_type_format(artifact.__class__, True)
+        if type_format is not None:
+            artifact_type, artifact_format = type_format
 
     if artifact_type is None or artifact_format is None:
         if strict:
@@ -59,6 +66,47 @@ def artifact_type_format(
     return artifact_type, artifact_format
 
 
+@functools.lru_cache(maxsize=None)
+def _artifact_entry_points_by_module() -> Dict[str, List[EntryPoint]]:
+    result = {}
+    for entry_point in pta.io.entry_points('pyterrier.artifact'):
+        result.setdefault(entry_point.value.split(':')[0].split('.')[0], []).append(entry_point)
+    return result
+
+
+def _entry_point_type_format(cls: Type, include_subclasses: bool) -> Optional[Tuple[str, str]]:
+    # Resolved once per class, since it may involve importing the modules of several entry points.
+    # The cache is keyed weakly, so that dynamically-created classes can still be garbage collected.
+    cache = _entry_point_type_format_cache[include_subclasses]
+    result = cache.get(cls, _MISSING)
+    if result is _MISSING:
+        result = None
+        # Only entry points that share the same top-level module are considered.
+        for entry_point in _artifact_entry_points_by_module().get(cls.__module__.split('.')[0], ()):
+            entry_point_cls = entry_point.load()
+            if cls == entry_point_cls or include_subclasses and issubclass(cls, entry_point_cls):
+                result = tuple(entry_point.name.split('.', 1))
+                break
+        cache[cls] = result
+    return result
+
+
+_entry_point_type_format_cache: Dict[bool, 'weakref.WeakKeyDictionary[Type, Optional[Tuple[str, str]]]'] = {
+    False: weakref.WeakKeyDictionary(),
+    True: weakref.WeakKeyDictionary(),
+}
+
+
+def _artifact_type_format_cache_clear() -> None:
+    pta.io.entry_points.cache_clear()
+    _artifact_entry_points_by_module.cache_clear()
+    for cache in _entry_point_type_format_cache.values():
+        cache.clear()
+
+
+artifact_type_format.cache_clear = _artifact_type_format_cache_clear
+
+
 @runtime_checkable
 class ProvidesTransformerOutputs(Protocol):
     """Protocol for transformers that provide a ``transform_outputs`` method."""
@@ -91,10 +139,46 @@ def transformer_outputs(
         InspectError: If the artifact's type or format could not be determined and ``strict==True``.
 
     .. versionadded:: 0.11.0
+
+    .. versionchanged:: 0.12.8
+        Results are cached for each transformer instance and set of input columns. Use
+        ``transformer_outputs.cache_clear()`` to clear the cache (e.g., if a transformer was modified).
     """
-    if isinstance(transformer, ProvidesTransformerOutputs):
+    input_columns = tuple(input_columns)
+    cache = _transformer_outputs_cache.get(id(transformer))
+    if cache is not None and input_columns in cache:
+        return list(cache[input_columns])
+
+    result = _transformer_outputs(transformer, list(input_columns), strict=strict)
+
+    if result is not None:
+        if cache is None:
+            try:
+                # drop the transformer's entries once it is garbage collected (its id may then be reused)
+                weakref.finalize(transformer, _transformer_outputs_cache.pop, id(transformer), None)
+            except TypeError:
+                return list(result) # transformer doesn't support weak references; don't cache
+            cache = _transformer_outputs_cache[id(transformer)] = {}
+        cache[input_columns] = list(result)
+        result = list(result) # always a fresh list, matching a cache hit
+    return result
+
+
+_transformer_outputs_cache: Dict[int, Dict[Tuple[str, ...], List[str]]] = {}
+transformer_outputs.cache_clear = _transformer_outputs_cache.clear
+
+
+def _transformer_outputs(
+    transformer: pt.Transformer,
+    input_columns: List[str],
+    *,
+    strict: bool,
+) -> Optional[List[str]]:
+    # equivalent to isinstance(transformer, ProvidesTransformerOutputs), but avoids the (slow) runtime protocol check
+    transform_outputs = getattr(transformer, 'transform_outputs', None)
+    if callable(transform_outputs):
         try:
-            return transformer.transform_outputs(input_columns)
+            return transform_outputs(input_columns)
         except Exception as ex:
             if strict:
                 raise InspectError(f"Cannot determine outputs for {transformer} with inputs: {input_columns}") from ex
@@ -102,10 +186,16 @@ def transformer_outputs(
                 return None
 
     try:
-        res = transformer.transform(pd.DataFrame(columns=input_columns))
+        # transformers may modify their input in place, so each probe gets its own copy of the (cached) empty frame
+        res = transformer.transform(_empty_frame(tuple(input_columns)).copy())
         return list(res.columns)
     except Exception as ex:
         if strict:
             raise InspectError(f"Cannot determine outputs for {transformer} with inputs: {input_columns}") from ex
         else:
             return None
+
+
+@functools.lru_cache(maxsize=64)
+def _empty_frame(columns: Tuple[str, ...]) -> pd.DataFrame:
+    return pd.DataFrame(columns=list(columns))
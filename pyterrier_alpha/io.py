@@ -1,21 +1,32 @@
 """Extension I/O utilities for PyTerrier."""
 
+import errno
+import functools
+import hashlib
 import io
+import itertools
 import os
 import shutil
 import tempfile
 import urllib
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack, contextmanager
 from hashlib import sha256
 from importlib.metadata import EntryPoint
 from importlib.metadata import entry_points as eps
-from typing import IO, BinaryIO, Callable, Iterable, Optional, Tuple
+from typing import IO, BinaryIO, Callable, Iterable, Iterator, Optional, Tuple, Union
 
 import pyterrier as pt
 from deprecated import deprecated
 
 DEFAULT_CHUNK_SIZE = 16_384 # 16kb
+DEFAULT_COPY_CHUNK_SIZE = 1_048_576 # 1mb
+
+
+_UMASK = os.umask(0) # the only way to read the umask is to set it, so do it once, before any threads are started
+os.umask(_UMASK)
 
 
 @contextmanager
@@ -29,7 +40,7 @@ def _finalized_open_base(path: str, mode: str, open_fn: Callable) -> io.IOBase:
         os.close(fd) # mkstemp returns a low-level file descriptor... Close it and re-open the file the normal way
         with open_fn(path_tmp, f'w{mode}') as fout:
             yield fout
-        os.chmod(path_tmp, 0o666) # default file umask
+        os.chmod(path_tmp, 0o666 & ~_UMASK) # mkstemp uses 0o600; match open()
     except:
         if path_tmp is not None:
             os.remove(path_tmp)
@@ -81,12 +92,52 @@ def finalized_directory(path: str) -> str:
     os.replace(path_tmp, path)
 
 
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Holds an exclusive lock on a file for the duration of the context, blocking until the lock is available.
+
+    The lock file is created if it doesn't exist, and is left in place afterwards (removing it would allow another
+    process that already opened it to hold a lock on a file that no longer exists).
+
+    Example:
+        Useful to avoid multiple processes populating the same cache entry at once::
+
+            with pta.io.file_lock(f'{path}.lock'):
+                if not os.path.exists(path):
+                    with pta.io.finalized_directory(path) as tmp_path:
+                        ... # populate tmp_path
+
+    .. versionadded:: 0.12.8
+    """
+    with open(path, 'ab') as f:
+        if os.name == 'nt':
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as ex:
+                    if ex.errno != errno.EDEADLK:
+                        raise
+                    # LK_LOCK gives up after 10 seconds (with EDEADLK); keep waiting
+            try:
+                yield
+            finally:
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def download(url: str, path: str, *, expected_sha256: str = None, verbose: bool = True) -> None:
     """Downloads a file from a URL to a local path."""
     with finalized_open(path, mode='b') as fout, \
          download_stream(url, expected_sha256=expected_sha256, verbose=verbose) as fin:
-        while chunk := fin.read1():
-            fout.write(chunk)
+        shutil.copyfileobj(fin, fout, length=DEFAULT_COPY_CHUNK_SIZE)
 
 
 @contextmanager
@@ -150,19 +201,32 @@ class _NosyReader(io.BufferedIOBase, ABC):
         pass
 
     def read1(self, size: int = -1) -> bytes:
-        if size == -1:
+        if size is None or size < 0:
             size = DEFAULT_CHUNK_SIZE
-        chunk = self.reader.read1(min(size, DEFAULT_CHUNK_SIZE))
+        chunk = self.reader.read1(size)
         self.on_data(chunk)
         return chunk
 
     def read(self, size: int = -1) -> bytes:
-        if size == -1:
+        if size is None or size < 0:
             size = DEFAULT_CHUNK_SIZE
-        chunk = self.reader.read(min(size, DEFAULT_CHUNK_SIZE))
+        chunk = self.reader.read(size)
         self.on_data(chunk)
         return chunk
 
+    def readinto(self, b: Union[bytearray, memoryview]) -> int:
+        # read straight into the caller's buffer and pass a view of it along, avoiding a bytes copy per chunk
+        count = self.reader.readinto(b)
+        if count:
+            self.on_data(memoryview(b).cast('B')[:count]) # count is in bytes, whatever the buffer's item type
+        return count
+
+    def readinto1(self, b: Union[bytearray, memoryview]) -> int:
+        count = self.reader.readinto1(b)
+        if count:
+            self.on_data(memoryview(b).cast('B')[:count]) # count is in bytes, whatever the buffer's item type
+        return count
+
     def close(self) -> None:
         self.reader.close()
 
@@ -200,11 +264,39 @@ class _NosyWriter(io.BufferedIOBase, ABC):
         self.close = self.writer.close
 
 
+def hash_function(name: str) -> Callable:
+    """Returns a function that constructs a hash object for the algorithm with the given name.
+
+    All fixed-length algorithms provided by :mod:`hashlib` are supported (e.g., ``sha256`` or ``blake2b``), as well as
+    ``blake3`` when the optional ``blake3`` package is installed. Variable-length algorithms (``shake_128`` and
+    ``shake_256``) are not supported, since their digests need an explicit length.
+
+    .. versionadded:: 0.12.8
+    """
+    if name == 'blake3':
+        try:
+            from blake3 import blake3
+        except ImportError as ex:
+            raise ImportError('blake3 hashing requires the blake3 package; install with `pip install blake3`') from ex
+        return blake3
+    if name.startswith('shake_'):
+        raise ValueError(f'Variable-length hash algorithm {name!r} is not supported')
+    if name in hashlib.algorithms_available:
+        return getattr(hashlib, name, functools.partial(hashlib.new, name))
+    raise ValueError(f'Unknown hash algorithm {name!r}')
+
+
 class HashReader(_NosyReader):
-    """A reader that computes the sha256 hash of the data read."""
-    def __init__(self, reader: io.IOBase, *, hashfn: Callable = sha256, expected: Optional[str] = None):
+    """A reader that computes the hash (sha256 by default) of the data read.
+
+    .. versionchanged:: 0.12.8
+        ``hashfn`` can also be the name of the hash algorithm (see :func:`hash_function`).
+    """
+    def __init__(self, reader: io.IOBase, *, hashfn: Union[Callable, str] = sha256, expected: Optional[str] = None):
         """Create a HashReader."""
         super().__init__(reader)
+        if isinstance(hashfn, str):
+            hashfn = hash_function(hashfn)
         self.hash = hashfn()
         self.expected = expected
 
@@ -221,14 +313,21 @@ class HashReader(_NosyReader):
         self.reader.close()
         if self.expected is not None:
             if self.expected.lower() != self.hexdigest():
-                raise ValueError(f'Expected sha256 {self.expected!r} but found {self.hexdigest()!r}')
+                name = getattr(self.hash, 'name', 'hash') # custom hash objects needn't provide a name
+                raise ValueError(f'Expected {name} {self.expected!r} but found {self.hexdigest()!r}')
 
 
 class HashWriter(_NosyWriter):
-    """A writer that computes the sha256 hash of the data written."""
-    def __init__(self, writer: io.IOBase, *, hashfn: Callable = sha256):
+    """A writer that computes the hash (sha256 by default) of the data written.
+
+    .. versionchanged:: 0.12.8
+        ``hashfn`` can also be the name of the hash algorithm (see :func:`hash_function`).
+    """
+    def __init__(self, writer: io.IOBase, *, hashfn: Union[Callable, str] = sha256):
         """Create a HashWriter."""
         super().__init__(writer)
+        if isinstance(hashfn, str):
+            hashfn = hash_function(hashfn)
         self.hash = hashfn()
 
     def on_data(self, data: bytes) -> None:
@@ -259,7 +358,11 @@ class TqdmReader(_NosyReader):
 
 
 class CallbackReader(_NosyReader):
-    """A reader that calls a callback with the data read."""
+    """A reader that calls a callback with the data read.
+
+    .. versionchanged:: 0.12.8
+        When read via ``readinto``, the callback receives a :class:`memoryview` of the data rather than ``bytes``.
+    """
     def __init__(self, reader: io.IOBase, callback: Callable):
         """Create a CallbackReader."""
         super().__init__(reader)
@@ -271,12 +374,21 @@ class CallbackReader(_NosyReader):
 
 
 class MultiReader(io.BufferedIOBase):
-    """A reader that reads from multiple readers in sequence."""
+    """A reader that reads from multiple readers in sequence.
+
+    .. versionchanged:: 0.12.8
+        ``readers`` can be any iterable (e.g., a list of readers that are already open), not only an iterator.
+    """
     def __init__(self, readers: Iterable[BinaryIO]):
         """Create a MultiReader."""
-        self.readers = readers
+        self.readers = iter(readers)
         self._reader = next(self.readers)
-        self.reader = self._reader.__enter__()
+        self._set_reader(self._reader.__enter__())
+
+    def _set_reader(self, reader: BinaryIO) -> None:
+        self.reader = reader
+        if hasattr(self.reader, 'pbar'):
+            self.pbar = self.reader.pbar
         self.seek = self.reader.seek
         self.tell = self.reader.tell
         self.seekable = self.reader.seekable
@@ -286,60 +398,118 @@ class MultiReader(io.BufferedIOBase):
         self.isatty = self.reader.isatty
         self.close = self.reader.close
 
+    def _next_reader(self) -> bool:
+        self.reader.close()
+        try:
+            self._reader = next(self.readers)
+        except StopIteration:
+            self._reader = None
+            self.reader = None
+            return False
+        self._set_reader(self._reader.__enter__())
+        return True
+
     def read1(self, size: int = -1) -> bytes:
         """Read a single chunk of data."""
-        if size == -1:
+        if size is None or size < 0:
             size = DEFAULT_CHUNK_SIZE
-        chunk = self.reader.read1(min(size, DEFAULT_CHUNK_SIZE))
-        if len(chunk) == 0:
-            self.reader.close()
-            try:
-                self._reader = next(self.readers)
-            except StopIteration:
-                self._reader = None
-                self.reader = None
-                return chunk
-            self.reader = self._reader.__enter__()
-            self.pbar = self.reader.pbar
-            self.seek = self.reader.seek
-            self.tell = self.reader.tell
-            self.seekable = self.reader.seekable
-            self.readable = self.reader.readable
-            self.writable = self.reader.writable
-            self.flush = self.reader.flush
-            self.isatty = self.reader.isatty
-            self.close = self.reader.close
-            chunk = self.reader.read1(min(size, DEFAULT_CHUNK_SIZE))
+        chunk = b''
+        while self.reader is not None:
+            chunk = self.reader.read1(size)
+            if len(chunk) > 0 or not self._next_reader():
+                break
         return chunk
 
     def read(self, size: int = -1) -> bytes:
         """Read data."""
         chunk = b''
-        if size == -1:
+        if size is None or size < 0:
             size = DEFAULT_CHUNK_SIZE
         while len(chunk) < size and self.reader is not None:
             chunk += self.reader.read(size - len(chunk))
-            if len(chunk) < size:
-                self.reader.close()
-                try:
-                    self._reader = next(self.readers)
-                except StopIteration:
-                    self._reader = None
-                    self.reader = None
-                    return chunk
-                self.reader = self._reader.__enter__()
-                self.pbar = self.reader.pbar
-                self.seek = self.reader.seek
-                self.tell = self.reader.tell
-                self.seekable = self.reader.seekable
-                self.readable = self.reader.readable
-                self.writable = self.reader.writable
-                self.flush = self.reader.flush
-                self.isatty = self.reader.isatty
-                self.close = self.reader.close
+            if len(chunk) < size and not self._next_reader():
+                break
         return chunk
 
 
+class PrefetchingMultiReader(MultiReader):
+    """A :class:`MultiReader` that fetches upcoming readers in the background.
+
+    The current reader is read directly, while up to ``prefetch`` of the following readers are copied into temporary
+    files by worker threads. This lets (for instance) the download of the next segment of a file overlap with the
+    processing of the current one. (The first reader is therefore never spooled to disk.)
+
+    Like :class:`MultiReader`, ``readers`` is an iterable of context managers that provide readers. Each prefetched one
+    is entered, read to the end, and closed by a worker thread, so errors raised when closing (e.g., a hash mismatch
+    from :class:`HashReader`) are raised when the corresponding reader is reached.
+
+    Closing the reader stops any prefetching that has not yet started and removes the temporary files.
+
+    .. versionadded:: 0.12.8
+    """
+    def __init__(self, readers: Iterable[BinaryIO], *, prefetch: int = 2):
+        """Create a PrefetchingMultiReader.
+
+        Args:
+            readers: The context managers that provide the readers, in order.
+            prefetch: The maximum number of upcoming readers to fetch in the background at once.
+        """
+        assert prefetch > 0
+        self.prefetch = prefetch
+        self._executor = ThreadPoolExecutor(max_workers=prefetch)
+        self._pending = deque()
+        super().__init__(self._prefetched(iter(readers)))
+
+    def _set_reader(self, reader: BinaryIO) -> None:
+        super()._set_reader(reader)
+        del self.close # use PrefetchingMultiReader.close, which also stops the prefetching
+
+    def _prefetched(self, readers: Iterator[BinaryIO]) -> Iterator[BinaryIO]:
+        try:
+            first = next(readers, None)
+            if first is None:
+                return
+            for reader in itertools.islice(readers, self.prefetch):
+                self._pending.append(self._executor.submit(self._spool, reader))
+            yield first # the current reader is read directly; only the upcoming ones are spooled
+            while self._pending:
+                future = self._pending.popleft()
+                for reader in itertools.islice(readers, 1):
+                    self._pending.append(self._executor.submit(self._spool, reader))
+                yield future.result()
+        finally:
+            while self._pending:
+                future = self._pending.popleft()
+                if not future.cancel():
+                    # already running or done; remove its temporary file once it's available
+                    future.add_done_callback(_close_spool)
+            self._executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        """Close the current reader and stop prefetching the upcoming ones."""
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+        self.readers.close()
+
+    @staticmethod
+    def _spool(reader: BinaryIO) -> BinaryIO:
+        spool = tempfile.TemporaryFile()
+        try:
+            with reader as fin:
+                shutil.copyfileobj(fin, spool, length=DEFAULT_COPY_CHUNK_SIZE)
+            spool.seek(0)
+        except:
+            spool.close()
+            raise
+        return spool
+
+
+def _close_spool(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
 def path_is_under_base(path: str, base: str) -> bool:
     """Returns True if the path is under the base directory."""
     return os.path.realpath(os.path.abspath(os.path.join(base, path))).startswith(os.path.realpath(base))
@@ -356,8 +526,14 @@ def byte_count_to_human_readable(byte_count: float) -> str:
     return f'{byte_count:.1f} {units[0]}'
 
 
+@functools.lru_cache(maxsize=None)
 def entry_points(group: str) -> Tuple[EntryPoint, ...]:
-    """Returns the entry points for a given group."""
+    """Returns the entry points for a given group.
+
+    .. versionchanged:: 0.12.8
+        Results are cached, since scanning the installed distributions is slow. Use ``entry_points.cache_clear()``
+        if packages are installed while the process is running.
+    """
     try:
         return tuple(eps(group=group))
     except TypeError:
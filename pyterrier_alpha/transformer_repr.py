@@ -1,7 +1,10 @@
 """Module providing a function that calculates a string representation function for transformers."""
 
 import inspect
-from typing import Any
+from typing import Any, Tuple
+from weakref import WeakKeyDictionary
+
+_INIT_PARAMETERS: 'WeakKeyDictionary[type, Tuple[Any, Tuple[inspect.Parameter, ...]]]' = WeakKeyDictionary()
 
 
 def transformer_repr(self: Any) -> str:
@@ -16,11 +19,15 @@ def transformer_repr(self: Any) -> str:
         Ignore verbose
     """
     cls = self.__class__
-    init = self.__init__
-    signature = inspect.signature(init)
+    # the constructor's signature is the same for every instance of the class, so only inspect it once
+    # (unless the class's __init__ has since been replaced)
+    init, parameters = _INIT_PARAMETERS.get(cls, (None, None))
+    if init is not cls.__init__:
+        parameters = tuple(inspect.signature(self.__init__).parameters.values())
+        _INIT_PARAMETERS[cls] = (cls.__init__, parameters)
     mode = 'pos'
     args = []
-    for p in signature.parameters.values():
+    for p in parameters:
         if p.kind not in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
             mode = 'kwd'
         try:
@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pyterrier_alpha as pta
+
+
+class MyArtifact(pta.Artifact):
+    ARTIFACT_TYPE = 'my_type'
+    ARTIFACT_FORMAT = 'my_format'
+
+
+class TestArtifactBuilder(unittest.TestCase):
+
+    def test_builder_metadata(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'artifact')
+            with pta.ArtifactBuilder(path=path, type='a', format='b', package_hint='c') as builder:
+                self.assertTrue(os.path.isdir(path))
+                builder.metadata['extra'] = 1
+            with open(os.path.join(path, 'pt_meta.json')) as fin:
+                self.assertEqual(json.load(fin), {'type': 'a', 'format': 'b', 'package_hint': 'c', 'extra': 1})
+
+    def test_builder_from_artifact(self):
+        with tempfile.TemporaryDirectory() as d:
+            artifact = MyArtifact(os.path.join(d, 'artifact'))
+            builder = pta.ArtifactBuilder(artifact)
+            self.assertEqual(builder.metadata['type'], 'my_type')
+            self.assertEqual(builder.metadata['format'], 'my_format')
+            self.assertEqual(builder.metadata['package_hint'], MyArtifact.__module__.split('.')[0])
+
+            builder = pta.ArtifactBuilder(artifact, format='other_format')
+            self.assertEqual(builder.metadata['type'], 'my_type')
+            self.assertEqual(builder.metadata['format'], 'other_format')
+
+    def test_builder_exists(self):
+        with tempfile.TemporaryDirectory() as d:
+            with self.assertRaises(FileExistsError):
+                with pta.ArtifactBuilder(path=d, type='a', format='b', package_hint='c'):
+                    pass
+
+    def test_builder_metadata_write_failure(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'artifact')
+            with self.assertRaises(TypeError):
+                with pta.ArtifactBuilder(path=path, type='a', format='b', package_hint='c') as builder:
+                    builder.metadata['extra'] = object() # not json serializable
+            self.assertEqual(os.listdir(path), [])
+
+    @unittest.skipIf(os.name == 'nt', 'file modes are not supported on Windows')
+    def test_builder_metadata_mode(self):
+        with tempfile.TemporaryDirectory() as d, mock.patch.object(pta.io, '_UMASK', 0o022):
+            path = os.path.join(d, 'artifact')
+            with pta.ArtifactBuilder(path=path, type='a', format='b', package_hint='c'):
+                pass
+            self.assertEqual(os.stat(os.path.join(path, 'pt_meta.json')).st_mode & 0o777, 0o644)
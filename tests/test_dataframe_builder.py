@@ -0,0 +1,156 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import pyterrier_alpha as pta
+
+
+class TestDataFrameBuilder(unittest.TestCase):
+
+    def test_lists_and_scalars(self):
+        builder = pta.DataFrameBuilder(['qid', 'docno', 'score'])
+        builder.extend({'qid': '1', 'docno': ['a', 'b', 'c'], 'score': [3., 2., 1.]})
+        builder.extend({'qid': '2', 'docno': ['d', 'e'], 'score': np.array([5., 4.])})
+        df = builder.to_df()
+        self.assertEqual(list(df.columns), ['qid', 'docno', 'score'])
+        self.assertEqual(list(df['qid']), ['1', '1', '1', '2', '2'])
+        self.assertEqual(list(df['docno']), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(list(df['score']), [3., 2., 1., 5., 4.])
+        self.assertEqual(df['score'].dtype, np.float64)
+
+    def test_mixed_chunk_types(self):
+        builder = pta.DataFrameBuilder(['score', 'rank'])
+        builder.extend({'score': [1, 2], 'rank': np.array([0, 1], dtype=np.int32)})
+        builder.extend({'score': np.array([0.5, 0.25], dtype=np.float32), 'rank': [2, 3]})
+        df = builder.to_df()
+        self.assertEqual(list(df['score']), [1., 2., 0.5, 0.25])
+        self.assertEqual(df['score'].dtype, np.float64)
+        self.assertEqual(list(df['rank']), [0, 1, 2, 3])
+        self.assertEqual(df['rank'].dtype, np.int64)
+
+    def test_all_scalars(self):
+        builder = pta.DataFrameBuilder(['qid', 'docno', 'score'])
+        for i in range(5):
+            builder.extend({'qid': '1', 'docno': f'd{i}', 'score': i})
+        df = builder.to_df()
+        self.assertEqual(len(df), 5)
+        self.assertEqual(list(df['qid']), ['1'] * 5)
+        self.assertEqual(list(df['docno']), [f'd{i}' for i in range(5)])
+        self.assertEqual(list(df['score']), list(range(5)))
+        self.assertEqual(df['score'].dtype, np.int64)
+
+    def test_scalars_then_lists(self):
+        builder = pta.DataFrameBuilder(['qid', 'docno'])
+        builder.extend({'qid': '1', 'docno': 'a'})
+        builder.extend({'qid': '2', 'docno': ['b', 'c']})
+        builder.extend({'qid': ['3', '4'], 'docno': 'd'})
+        df = builder.to_df()
+        self.assertEqual(list(df['qid']), ['1', '2', '2', '3', '4'])
+        self.assertEqual(list(df['docno']), ['a', 'b', 'c', 'd', 'd'])
+
+    def test_repeated_scalars(self):
+        builder = pta.DataFrameBuilder(['qid', 'rank', 'docno', 'tag'])
+        builder.extend({'qid': '1', 'rank': 0, 'docno': ['a', 'b'], 'tag': 'y'})
+        builder.extend({'qid': '2', 'rank': 1, 'docno': ['c', 'd', 'e'], 'tag': 'x'})
+        df = builder.to_df()
+        self.assertEqual(list(df['qid']), ['1', '1', '2', '2', '2'])
+        self.assertEqual(list(df['rank']), [0, 0, 1, 1, 1])
+        self.assertEqual(df['rank'].dtype, np.int64)
+        self.assertEqual(list(df['tag']), ['y', 'y', 'x', 'x', 'x'])
+
+    def test_scalars_then_arrays(self):
+        builder = pta.DataFrameBuilder(['score'])
+        builder.extend({'score': 1})
+        builder.extend({'score': 2})
+        builder.extend({'score': np.array([0.5, 0.25], dtype=np.float32)})
+        builder.extend({'score': [3, 4]})
+        df = builder.to_df()
+        self.assertEqual(list(df['score']), [1., 2., 0.5, 0.25, 3., 4.])
+        self.assertEqual(df['score'].dtype, np.float64)
+
+    def test_broadcast_length_one(self):
+        builder = pta.DataFrameBuilder(['qid', 'vec', 'docno'])
+        vec = np.array([1., 2., 3.])
+        builder.extend({'qid': ['1'], 'vec': [vec], 'docno': ['a', 'b']})
+        builder.extend({'qid': ('2',), 'vec': [vec * 2], 'docno': ['c', 'd']})
+        df = builder.to_df()
+        self.assertEqual(list(df['qid']), ['1', '1', '2', '2'])
+        self.assertEqual(len(df['vec']), 4)
+        np.testing.assert_array_equal(df['vec'].iloc[1], vec)
+        np.testing.assert_array_equal(df['vec'].iloc[2], vec * 2)
+
+    def test_array_values(self):
+        builder = pta.DataFrameBuilder(['qid', 'vec'])
+        builder.extend({'qid': '1', 'vec': [np.array([1, 2]), np.array([3, 4])]})
+        builder.extend({'qid': '2', 'vec': [np.array([5, 6]), np.array([7, 8])]})
+        df = builder.to_df()
+        self.assertEqual(len(df), 4)
+        np.testing.assert_array_equal(np.stack(df['vec']), [[1, 2], [3, 4], [5, 6], [7, 8]])
+
+    def test_series(self):
+        builder = pta.DataFrameBuilder(['qid', 'score'])
+        builder.extend({'qid': '1', 'score': pd.Series([1., 2.], index=[10, 11])})
+        builder.extend({'qid': '2', 'score': pd.Series([3., 4.], index=[7, 8])})
+        df = builder.to_df()
+        self.assertEqual(list(df['score']), [1., 2., 3., 4.])
+        self.assertEqual(list(df.index), [0, 1, 2, 3])
+
+    def test_series_extension_dtype(self):
+        builder = pta.DataFrameBuilder(['qid', 'rank'])
+        builder.extend({'qid': '1', 'rank': pd.Series([1, None], dtype='Int64')})
+        builder.extend({'qid': '2', 'rank': pd.Series([3, 4], dtype='Int64')})
+        df = builder.to_df()
+        self.assertEqual(df['rank'].dtype, pd.Int64Dtype())
+        self.assertEqual(df['rank'].isna().tolist(), [False, True, False, False])
+
+    def test_merge_on_index(self):
+        inp = pd.DataFrame({'qid': ['1', '2'], 'query': ['a', 'b'], 'extra': [True, False]}, index=[5, 6])
+        builder = pta.DataFrameBuilder(['docno', 'score'])
+        builder.extend({'docno': ['x', 'y'], 'score': [2., 1.]})
+        builder.extend({'docno': ['z'], 'score': [3.]})
+        df = builder.to_df(inp)
+        self.assertEqual(list(df.columns), ['qid', 'query', 'extra', 'docno', 'score'])
+        self.assertEqual(list(df['qid']), ['1', '1', '2'])
+        self.assertEqual(list(df['query']), ['a', 'a', 'b'])
+        self.assertEqual(list(df['extra']), [True, True, False])
+        self.assertEqual(list(df['docno']), ['x', 'y', 'z'])
+
+    def test_merge_on_index_overlapping_columns(self):
+        inp = pd.DataFrame({'qid': ['1', '2'], 'score': [0., 0.]})
+        builder = pta.DataFrameBuilder(['score'])
+        builder.extend({'score': [2., 1.]})
+        builder.extend({'score': 3.})
+        df = builder.to_df(inp)
+        self.assertEqual(list(df.columns), ['qid', 'score'])
+        self.assertEqual(list(df['qid']), ['1', '1', '2'])
+        self.assertEqual(list(df['score']), [2., 1., 3.])
+
+    def test_explicit_index(self):
+        inp = pd.DataFrame({'qid': ['1', '2', '3']})
+        builder = pta.DataFrameBuilder(['docno'])
+        builder.extend({'_index': 2, 'docno': ['a', 'b']})
+        builder.extend({'_index': 0, 'docno': 'c'})
+        df = builder.to_df(inp)
+        self.assertEqual(list(df['qid']), ['3', '3', '1'])
+        self.assertEqual(list(df['docno']), ['a', 'b', 'c'])
+
+    def test_index_only(self):
+        inp = pd.DataFrame({'qid': ['1', '2', '3']})
+        builder = pta.DataFrameBuilder([])
+        builder.extend({'_index': 2})
+        builder.extend({'_index': 0})
+        self.assertEqual(len(builder.to_df()), 2)
+        df = builder.to_df(inp)
+        self.assertEqual(list(df.columns), ['qid'])
+        self.assertEqual(list(df['qid']), ['3', '1'])
+
+    def test_missing_column(self):
+        builder = pta.DataFrameBuilder(['qid', 'docno'])
+        with self.assertRaises(AssertionError):
+            builder.extend({'qid': '1'})
+
+    def test_length_mismatch(self):
+        builder = pta.DataFrameBuilder(['qid', 'docno'])
+        with self.assertRaises(AssertionError):
+            builder.extend({'qid': ['1', '2'], 'docno': ['a', 'b', 'c']})
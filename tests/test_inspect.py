@@ -0,0 +1,77 @@
+import gc
+import unittest
+import weakref
+
+import pyterrier as pt
+
+import pyterrier_alpha as pta
+
+
+class WithConstants(pta.Artifact):
+    ARTIFACT_TYPE = 'my_type'
+    ARTIFACT_FORMAT = 'my_format'
+
+
+class WithoutConstants(pta.Artifact):
+    pass
+
+
+class TestInspect(unittest.TestCase):
+
+    def test_artifact_type_format(self):
+        self.assertEqual(pta.inspect.artifact_type_format(WithConstants), ('my_type', 'my_format'))
+        self.assertEqual(pta.inspect.artifact_type_format(WithConstants('path')), ('my_type', 'my_format'))
+
+    def test_artifact_type_format_missing(self):
+        self.assertIsNone(pta.inspect.artifact_type_format(WithoutConstants, strict=False))
+        self.assertIn(WithoutConstants, pta.inspect._entry_point_type_format_cache[False])
+        self.assertIsNone(pta.inspect.artifact_type_format(WithoutConstants, strict=False))
+        with self.assertRaises(pta.inspect.InspectError):
+            pta.inspect.artifact_type_format(WithoutConstants('path'))
+        self.assertIn(WithoutConstants, pta.inspect._entry_point_type_format_cache[True])
+        pta.inspect.artifact_type_format.cache_clear()
+        self.assertNotIn(WithoutConstants, pta.inspect._entry_point_type_format_cache[False])
+        self.assertNotIn(WithoutConstants, pta.inspect._entry_point_type_format_cache[True])
+        self.assertIsNone(pta.inspect.artifact_type_format(WithoutConstants, strict=False))
+
+    def test_artifact_type_format_cache_collectable(self):
+        cls = type('DynamicArtifact', (pta.Artifact,), {})
+        self.assertIsNone(pta.inspect.artifact_type_format(cls, strict=False))
+        ref = weakref.ref(cls)
+        del cls
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_transformer_outputs_cached(self):
+        calls = []
+        def fn(inp):
+            calls.append(list(inp.columns))
+            return inp.assign(score=[])
+        transformer = pt.apply.generic(fn)
+        self.assertEqual(pta.inspect.transformer_outputs(transformer, ['qid', 'docno']), ['qid', 'docno', 'score'])
+        self.assertEqual(pta.inspect.transformer_outputs(transformer, ['qid', 'docno']), ['qid', 'docno', 'score'])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(pta.inspect.transformer_outputs(transformer, ['qid']), ['qid', 'score'])
+        self.assertEqual(len(calls), 2)
+        pta.inspect.transformer_outputs.cache_clear()
+        pta.inspect.transformer_outputs(transformer, ['qid', 'docno'])
+        self.assertEqual(len(calls), 3)
+
+    def test_transformer_outputs_returns_list(self):
+        class TupleOutputs(pt.Transformer):
+            def transform(self, inp):
+                return inp
+            def transform_outputs(self, input_columns):
+                return tuple(input_columns) + ('score',)
+        transformer = TupleOutputs()
+        result = pta.inspect.transformer_outputs(transformer, ['qid'])
+        self.assertEqual(result, ['qid', 'score'])
+        result.append('mutated')
+        self.assertEqual(pta.inspect.transformer_outputs(transformer, ['qid']), ['qid', 'score'])
+
+    def test_transformer_outputs_inplace(self):
+        def fn(inp):
+            inp['score'] = []
+            return inp
+        self.assertEqual(pta.inspect.transformer_outputs(pt.apply.generic(fn), ['qid']), ['qid', 'score'])
+        self.assertEqual(pta.inspect.transformer_outputs(pt.apply.generic(lambda x: x), ['qid']), ['qid'])
@@ -0,0 +1,198 @@
+import array
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+from hashlib import blake2b, sha256
+
+import pyterrier_alpha as pta
+
+
+class TestIo(unittest.TestCase):
+
+    def test_hash_reader_large_read(self):
+        data = os.urandom(3 * pta.io.DEFAULT_COPY_CHUNK_SIZE + 7)
+        reader = pta.io.HashReader(io.BytesIO(data), expected=sha256(data).hexdigest())
+        chunk = reader.read(pta.io.DEFAULT_COPY_CHUNK_SIZE)
+        self.assertEqual(len(chunk), pta.io.DEFAULT_COPY_CHUNK_SIZE)
+        rest = b''
+        while c := reader.read(pta.io.DEFAULT_COPY_CHUNK_SIZE):
+            rest += c
+        self.assertEqual(chunk + rest, data)
+        reader.close()
+
+    def test_hash_reader_mismatch(self):
+        reader = pta.io.HashReader(io.BytesIO(b'hello world'), expected='0' * 64)
+        reader.read()
+        with self.assertRaises(ValueError):
+            reader.close()
+
+    def test_hash_reader_mismatch_unnamed_hash(self):
+        class UnnamedHash:
+            def update(self, data):
+                pass
+            def hexdigest(self):
+                return '0' * 8
+        reader = pta.io.HashReader(io.BytesIO(b'hello world'), hashfn=UnnamedHash, expected='1' * 8)
+        reader.read()
+        with self.assertRaises(ValueError):
+            reader.close()
+
+    def test_hash_reader_readinto(self):
+        data = os.urandom(100_000)
+        reader = pta.io.HashReader(io.BytesIO(data), expected=sha256(data).hexdigest())
+        buffer = bytearray(30_000)
+        result = b''
+        while count := reader.readinto(buffer):
+            result += buffer[:count]
+        self.assertEqual(result, data)
+        reader.close()
+
+    def test_hash_reader_readinto_typed_buffer(self):
+        data = os.urandom(100)
+        reader = pta.io.HashReader(io.BytesIO(data), expected=sha256(data).hexdigest())
+        buffer = array.array('f', [0.] * 1000)
+        self.assertEqual(reader.readinto(buffer), 100)
+        self.assertEqual(buffer.tobytes()[:100], data)
+        self.assertEqual(reader.hexdigest(), sha256(data).hexdigest())
+        reader.close()
+
+    def test_hash_writer(self):
+        data = os.urandom(100_000)
+        buffer = io.BytesIO()
+        writer = pta.io.HashWriter(buffer)
+        writer.write(data[:10])
+        writer.write(data[10:])
+        self.assertEqual(writer.hexdigest(), sha256(data).hexdigest())
+        self.assertEqual(buffer.getvalue(), data)
+
+    def test_hash_by_name(self):
+        data = os.urandom(1000)
+        writer = pta.io.HashWriter(io.BytesIO(), hashfn='blake2b')
+        writer.write(data)
+        self.assertEqual(writer.hexdigest(), blake2b(data).hexdigest())
+        reader = pta.io.HashReader(io.BytesIO(data), hashfn='blake2b', expected=blake2b(data).hexdigest())
+        reader.read(len(data))
+        reader.close()
+        with self.assertRaises(ValueError):
+            pta.io.hash_function('not-a-hash')
+        with self.assertRaises(ValueError):
+            pta.io.hash_function('shake_128')
+        with self.assertRaises(ValueError):
+            pta.io.HashWriter(io.BytesIO(), hashfn='shake_256')
+
+    def test_hash_blake3(self):
+        try:
+            from blake3 import blake3
+        except ImportError:
+            self.skipTest('blake3 not installed')
+        data = os.urandom(1000)
+        writer = pta.io.HashWriter(io.BytesIO(), hashfn='blake3')
+        writer.write(data)
+        self.assertEqual(writer.hexdigest(), blake3(data).hexdigest())
+
+    def test_multi_reader(self):
+        segments = [os.urandom(n) for n in [100, 0, 20_000, 5]]
+        reader = pta.io.MultiReader([io.BytesIO(s) for s in segments])
+        result = b''
+        while chunk := reader.read1(1000):
+            result += chunk
+        self.assertEqual(result, b''.join(segments))
+        self.assertEqual(reader.read1(1000), b'')
+
+        reader = pta.io.MultiReader(io.BytesIO(s) for s in segments)
+        self.assertEqual(reader.read(150), b''.join(segments)[:150])
+        self.assertEqual(reader.read(100_000), b''.join(segments)[150:])
+        self.assertEqual(reader.read(100), b'')
+
+    def test_prefetching_multi_reader(self):
+        segments = [os.urandom(n) for n in [100, pta.io.DEFAULT_COPY_CHUNK_SIZE + 3, 5, 17]]
+        reader = pta.io.PrefetchingMultiReader((io.BytesIO(s) for s in segments), prefetch=2)
+        result = b''
+        while chunk := reader.read1(1000):
+            result += chunk
+        self.assertEqual(result, b''.join(segments))
+
+    def test_prefetching_multi_reader_streams_current(self):
+        first = io.BytesIO(b'first')
+        reader = pta.io.PrefetchingMultiReader([first, io.BytesIO(b'second')], prefetch=1)
+        self.assertIs(reader.reader, first) # read directly, not spooled to a temporary file
+        self.assertEqual(reader.read(100), b'firstsecond')
+        reader.close()
+
+    def test_prefetching_multi_reader_early_close(self):
+        release = threading.Event()
+        entered = []
+        class Segment(io.BytesIO):
+            def __enter__(self):
+                entered.append(self)
+                if self is not segments[0]:
+                    release.wait(5) # simulate a slow download
+                return self
+        segments = [Segment(os.urandom(100)) for _ in range(5)]
+        reader = pta.io.PrefetchingMultiReader(iter(segments), prefetch=1)
+        self.assertEqual(len(reader.read(5)), 5)
+        executor = reader._executor
+        reader.close()
+        release.set()
+        executor.shutdown(wait=True)
+        # only the current segment and the one already being prefetched were started
+        self.assertCountEqual(entered, segments[:2])
+        self.assertTrue(segments[0].closed)
+        self.assertTrue(segments[1].closed)
+
+    def test_prefetching_multi_reader_hash_mismatch(self):
+        segments = [
+            pta.io.HashReader(io.BytesIO(b'a'), expected=sha256(b'a').hexdigest()),
+            pta.io.HashReader(io.BytesIO(b'b'), expected=sha256(b'a').hexdigest()),
+        ]
+        reader = pta.io.PrefetchingMultiReader(iter(segments))
+        with self.assertRaises(ValueError):
+            while reader.read(10):
+                pass
+
+    def test_open_or_download_stream_local(self):
+        data = os.urandom(2 * pta.io.DEFAULT_COPY_CHUNK_SIZE)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'file.bin')
+            with open(path, 'wb') as fout:
+                fout.write(data)
+            with pta.io.open_or_download_stream(path, expected_sha256=sha256(data).hexdigest(), verbose=False) as fin:
+                result = fin.read(len(data))
+        self.assertEqual(result, data)
+
+    def test_finalized_open(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'file.txt')
+            with pta.io.finalized_open(path, 't') as fout:
+                fout.write('some text')
+            with self.assertRaises(RuntimeError):
+                with pta.io.finalized_open(path, 't') as fout:
+                    fout.write('some other text')
+                    raise RuntimeError()
+            with open(path) as fin:
+                self.assertEqual(fin.read(), 'some text')
+            self.assertEqual(os.listdir(d), ['file.txt'])
+
+    def test_file_lock(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'file.lock')
+            events = []
+            def worker():
+                with pta.io.file_lock(path):
+                    events.append('worker')
+            with pta.io.file_lock(path):
+                thread = threading.Thread(target=worker)
+                thread.start()
+                time.sleep(0.1)
+                events.append('main')
+            thread.join()
+            self.assertEqual(events, ['main', 'worker'])
+
+    def test_entry_points_cached(self):
+        eps = pta.io.entry_points('pyterrier.artifact.url_protocol_resolver')
+        self.assertIs(pta.io.entry_points('pyterrier.artifact.url_protocol_resolver'), eps)
+        pta.io.entry_points.cache_clear()
+        self.assertEqual(pta.io.entry_points('pyterrier.artifact.url_protocol_resolver'), eps)
@@ -1,3 +1,4 @@
+import sys
 import unittest
 import pyterrier as pt
 from pyterrier_alpha import transformer_repr
@@ -31,3 +32,35 @@ class TestTransformerRepr(unittest.TestCase):
         self.assertEqual("MyTransformer(1, 'a', 2)", repr(MyTransformer(1, "a", c=2)))
         self.assertEqual("MyTransformer(1, 'a', 2)", repr(MyTransformer(1, "a", c=2)))
         self.assertEqual('MyTransformer(1, d=2)', repr(MyTransformer(1, d=2)))
+
+    def test_cached(self):
+        transformer_repr_module = sys.modules[transformer_repr.__module__]
+        repr(MyTransformer(1))
+        init, parameters = transformer_repr_module._INIT_PARAMETERS[MyTransformer]
+        self.assertIs(init, MyTransformer.__init__)
+        self.assertEqual([p.name for p in parameters], ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual('MyTransformer(2, c=3)', repr(MyTransformer(2, c=3)))
+        self.assertIs(transformer_repr_module._INIT_PARAMETERS[MyTransformer][1], parameters) # cache hit
+
+        class MySubTransformer(MyTransformer):
+            def __init__(self, a, g=2):
+                super().__init__(a)
+                self.g = g
+        self.assertEqual('MySubTransformer(1, 3)', repr(MySubTransformer(1, 3)))
+        self.assertEqual('MyTransformer(1)', repr(MyTransformer(1)))
+        self.assertIn(MySubTransformer, transformer_repr_module._INIT_PARAMETERS)
+        self.assertIs(transformer_repr_module._INIT_PARAMETERS[MyTransformer][1], parameters)
+
+    def test_init_replaced(self):
+        class MyOtherTransformer(pt.Transformer):
+            def __init__(self, a=1):
+                self.a = a
+            def transform(self, inp):
+                return inp
+            __repr__ = transformer_repr
+        self.assertEqual('MyOtherTransformer(2)', repr(MyOtherTransformer(2)))
+        def __init__(self, b=1):
+            self.b = b
+        MyOtherTransformer.__init__ = __init__
+        self.assertEqual('MyOtherTransformer(3)', repr(MyOtherTransformer(3)))
+        self.assertEqual('MyOtherTransformer()', repr(MyOtherTransformer(1)))